@@ -3,6 +3,8 @@ Database Utility Module
 Provides secure database connections using environment variables.
 """
 
+import atexit
+import logging
 import mariadb # type: ignore
 import os
 from dotenv import load_dotenv # type: ignore
@@ -11,91 +13,178 @@ from typing import Optional
 # Load environment variables from .env file
 load_dotenv()
 
+# Module logger. Connection open/close happens on every pooled borrow, so
+# these messages are gated by level instead of printed unconditionally.
+log = logging.getLogger(__name__)
+
+def _load_db_kwargs() -> dict:
+    """
+    Parse the database settings from the environment exactly once.
+
+    Returns:
+        dict: Keyword arguments for mariadb connections
+
+    Raises:
+        RuntimeError: If a setting is missing or DB_PORT is not a number
+    """
+    try:
+        kwargs = {
+            'host': os.getenv('DB_HOST'),
+            'port': int(os.getenv('DB_PORT', 3306)),
+            'user': os.getenv('DB_USER'),
+            'password': os.getenv('DB_PASSWORD'),
+            'database': os.getenv('DB_DATABASE'),
+        }
+    except (ValueError, TypeError) as e:
+        raise RuntimeError(
+            f"Invalid DB_PORT value: {e}. "
+            "Please check your .env file and ensure all required variables are set."
+        ) from e
+
+    missing = [name for name, value in kwargs.items() if value is None]
+    if missing:
+        raise RuntimeError(
+            "Missing database settings: "
+            + ", ".join(f"DB_{name.upper()}" for name in missing)
+            + ". Please check your .env file and ensure all required variables are set."
+        )
+    return kwargs
+
+# Parsed once at import so connects don't repeat the os.getenv lookups
+# and the DB_PORT string-to-int conversion on every call.
+_DB_KWARGS = _load_db_kwargs()
+
+# Shared connection pool. Creating a connection is the expensive part of
+# talking to MariaDB (TCP handshake + authentication), so we do it once and
+# hand out pooled connections instead of reconnecting on every call.
+_POOL: Optional[mariadb.ConnectionPool] = None
+
+def _get_pool() -> mariadb.ConnectionPool:
+    """
+    Return the shared connection pool, creating it on first use.
+
+    Returns:
+        mariadb.ConnectionPool: The module-wide connection pool
+    """
+    global _POOL
+    if _POOL is None:
+        # pool_reset_connection=False skips the COM_RESET_CONNECTION
+        # round-trip on every release. This assumes borrowers don't leak
+        # session state (autocommit, session variables); callers that do
+        # should use DatabaseConnection(reset=True) for that borrow.
+        _POOL = mariadb.ConnectionPool(
+            pool_name="app",
+            pool_size=int(os.getenv('DB_POOL_SIZE', 8)),
+            pool_reset_connection=False,
+            **_DB_KWARGS
+        )
+        atexit.register(_POOL.close)
+    return _POOL
+
 class DatabaseConnection:
     """
     A context manager for MariaDB database connections.
     Automatically handles connection opening and closing.
     """
     
-    def __init__(self):
+    def __init__(self, reset: bool = False):
         self.connection: Optional[mariadb.Connection] = None
+        # Set reset=True if you change session state (autocommit, session
+        # variables) inside the block, so it is wiped before reuse.
+        self.reset = reset
         
     def __enter__(self):
-        """Establish database connection."""
+        """Borrow a database connection from the pool."""
         try:
-            self.connection = mariadb.connect(
-                host=os.getenv('DB_HOST'),
-                port=int(os.getenv('DB_PORT', 3306)),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_DATABASE')
-            )
-            print("✅ Database connection established!")
+            self.connection = _get_pool().get_connection()
+            log.info("Database connection established")
             return self.connection
-            
+
         except mariadb.Error as e:
-            print(f"❌ Error connecting to MariaDB: {e}")
-            raise
-        except (ValueError, TypeError) as e:
-            print(f"❌ Environment variable error: {e}")
-            print("Please check your .env file and ensure all required variables are set.")
+            log.error("Error connecting to MariaDB: %s", e)
             raise
             
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Close database connection."""
+        """Return the connection to the pool."""
         if self.connection:
-            self.connection.close()
-            print("🔒 Database connection closed.")
+            try:
+                if self.reset:
+                    self.connection.reset()
+            except mariadb.Error as e:
+                # A dead connection can fail the reset; don't let that
+                # mask the with-body's exception or skip the release.
+                log.error("Error resetting connection: %s", e)
+            finally:
+                self.connection.close()
+                log.info("Database connection returned to pool")
 
 def connect_to_mariadb() -> Optional[mariadb.Connection]:
     """
-    Create a database connection using environment variables.
+    Get a database connection from the shared pool.
     
     Returns:
         mariadb.Connection or None: Database connection object or None if failed
     """
     try:
-        conn = mariadb.connect(
-            host=os.getenv('DB_HOST'),
-            port=int(os.getenv('DB_PORT', 3306)),
-            user=os.getenv('DB_USER'),
-            password=os.getenv('DB_PASSWORD'),
-            database=os.getenv('DB_DATABASE')
-        )
-        print("✅ Database connection successful!")
+        conn = _get_pool().get_connection()
+        log.info("Database connection successful")
         return conn
-        
+
     except mariadb.Error as e:
-        print(f"❌ Error connecting to MariaDB: {e}")
-        return None
-    except (ValueError, TypeError) as e:
-        print(f"❌ Environment variable error: {e}")
-        print("Please check your .env file and ensure all required variables are set.")
+        log.error("Error connecting to MariaDB: %s", e)
         return None
 
 def disconnect_from_mariadb(conn: Optional[mariadb.Connection]) -> None:
     """
-    Close a database connection safely.
-    
+    Return a database connection to the pool safely.
+
     Args:
-        conn: The database connection to close
+        conn: The database connection to release
     """
     if conn:
         conn.close()
-        print("🔒 Database connection closed.")
+        log.info("Database connection returned to pool")
+
+def bulk_insert(conn: mariadb.Connection, table: str, cols: list, rows: list) -> None:
+    """
+    Insert many rows through a single prepared statement.
+
+    executemany batches every row against one prepared INSERT, so the
+    whole insert costs one round-trip instead of one per row.
+
+    Args:
+        conn: An open database connection
+        table: Target table name
+        cols: Column names, in the same order as the row values
+        rows: Sequences of values, one per row
+    """
+    placeholders = ','.join(['?'] * len(cols))
+    sql = f"INSERT INTO {table} ({','.join(cols)}) VALUES ({placeholders})"
+    cursor = conn.cursor(prepared=True)
+    cursor.executemany(sql, rows)
+    conn.commit()
 
 def test_connection() -> bool:
     """
     Test the database connection and return success status.
-    
+
+    Pings a pooled connection (a one-byte COM_PING round-trip) instead
+    of paying for a full handshake and teardown, so this is cheap enough
+    for tight monitoring loops.
+
     Returns:
         bool: True if connection successful, False otherwise
     """
-    conn = connect_to_mariadb()
-    if conn:
-        disconnect_from_mariadb(conn)
+    try:
+        conn = _get_pool().get_connection()
+        try:
+            conn.ping()
+        finally:
+            conn.close()
         return True
-    return False
+    except mariadb.Error as e:
+        log.error("Database ping failed: %s", e)
+        return False
 
 # Example usage with context manager
 if __name__ == "__main__":
@@ -5,12 +5,96 @@ Creates a PyQt6 dialog window for dragging and dropping PDF files
 
 import sys
 import os
+import threading
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,   # type: ignore
                             QWidget, QLabel, QPushButton, QTextEdit, QFileDialog,
                             QMessageBox, QFrame) # type: ignore
 from PyQt6.QtCore import Qt, pyqtSignal # type: ignore
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QFont, QPalette, QColor # type: ignore
 
+from pdfCodeFiles.pdfs import extract_pdfs
+
+# Case variants checked directly with str.endswith, which runs in C and
+# allocates nothing, unlike lowercasing a copy of every path first.
+_PDF_EXTS = ('.pdf', '.PDF', '.Pdf')
+
+# Stylesheets defined once at module level so Qt's CSS parser only sees
+# each string once, instead of re-tokenizing a fresh literal every time
+# a widget is constructed or a drag event restyles the drop zone.
+_DROPZONE_NORMAL_QSS = """
+    QFrame {
+        background-color: #000000;
+        border: 2px dashed #cccccc;
+        border-radius: 10px;
+    }
+"""
+
+_DROPZONE_HOVER_QSS = """
+    QFrame {
+        background-color: #e6f3ff;
+        border: 2px dashed #007acc;
+        border-radius: 10px;
+    }
+"""
+
+_BROWSE_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        font-size: 14px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+
+_CLEAR_QSS = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        font-size: 14px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #da190b;
+    }
+"""
+
+_PROCESS_QSS = """
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        font-size: 14px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover:enabled {
+        background-color: #1976D2;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+_FILELIST_QSS = """
+    QTextEdit {
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        padding: 10px;
+        font-family: monospace;
+        background-color: #000000;
+    }
+"""
+
 class DropZone(QFrame):
     """Custom widget that accepts drag and drop files"""
     
@@ -65,30 +149,18 @@ class DropZone(QFrame):
     
     def set_normal_style(self):
         """Set normal appearance"""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #000000;
-                border: 2px dashed #cccccc;
-                border-radius: 10px;
-            }
-        """)
-    
+        self.setStyleSheet(_DROPZONE_NORMAL_QSS)
+
     def set_hover_style(self):
         """Set hover appearance when dragging over"""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #e6f3ff;
-                border: 2px dashed #007acc;
-                border-radius: 10px;
-            }
-        """)
+        self.setStyleSheet(_DROPZONE_HOVER_QSS)
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event"""
         if event.mimeData().hasUrls():
             # Check if any of the dragged files are PDFs
             urls = event.mimeData().urls()
-            has_pdf = any(url.toLocalFile().lower().endswith('.pdf') for url in urls)
+            has_pdf = any(url.toLocalFile().endswith(_PDF_EXTS) for url in urls)
             
             if has_pdf:
                 event.acceptProposedAction()
@@ -111,7 +183,7 @@ class DropZone(QFrame):
             files = []
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if os.path.isfile(file_path) and file_path.lower().endswith('.pdf'):
+                if os.path.isfile(file_path) and file_path.endswith(_PDF_EXTS):
                     files.append(file_path)
             
             if files:
@@ -125,10 +197,20 @@ class DropZone(QFrame):
 
 class PDFDropDialog(QMainWindow):
     """Main dialog window for PDF drag and drop"""
-    
+
+    # Emitted from the extraction worker thread; Qt queues the delivery
+    # back onto the GUI thread, so the connected slots can touch widgets.
+    extraction_finished = pyqtSignal(list)
+    extraction_failed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
+        self.extraction_finished.connect(self.show_extraction_results)
+        self.extraction_failed.connect(self.show_extraction_error)
         self.selected_files = []
+        # Mirror of selected_files for O(1) duplicate checks; scanning the
+        # list per insertion is quadratic over a large dropped batch.
+        self._selected_set = set()
         self.setup_ui()
     
     def setup_ui(self):
@@ -162,60 +244,18 @@ class PDFDropDialog(QMainWindow):
         # Browse button
         self.browse_btn = QPushButton("📂 Browse Files")
         self.browse_btn.clicked.connect(self.browse_files)
-        self.browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.browse_btn.setStyleSheet(_BROWSE_QSS)
         
         # Clear button
         self.clear_btn = QPushButton("🗑️ Clear All")
         self.clear_btn.clicked.connect(self.clear_files)
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
+        self.clear_btn.setStyleSheet(_CLEAR_QSS)
         
         # Process button
         self.process_btn = QPushButton("⚡ Process PDFs")
         self.process_btn.clicked.connect(self.process_files)
         self.process_btn.setEnabled(False)
-        self.process_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover:enabled {
-                background-color: #1976D2;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.process_btn.setStyleSheet(_PROCESS_QSS)
         
         buttons_layout.addWidget(self.browse_btn)
         buttons_layout.addWidget(self.clear_btn)
@@ -226,15 +266,7 @@ class PDFDropDialog(QMainWindow):
         self.file_list = QTextEdit()
         self.file_list.setMaximumHeight(150)
         self.file_list.setPlaceholderText("Selected PDF files will appear here...")
-        self.file_list.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: monospace;
-                background-color: #000000;
-            }
-        """)
+        self.file_list.setStyleSheet(_FILELIST_QSS)
         
         # Status label
         self.status_label = QLabel("Ready to accept PDF files")
@@ -250,12 +282,24 @@ class PDFDropDialog(QMainWindow):
         
         central_widget.setLayout(layout)
     
+    def _add_file(self, file_path):
+        """Track a newly selected file and show it in the list"""
+        self._selected_set.add(file_path)
+        self.selected_files.append(file_path)
+        filename = os.path.basename(file_path)
+        file_size = os.path.getsize(file_path) / 1024  # KB
+
+        # Append just the new entry; rebuilding the whole list with
+        # setText forces QTextEdit to re-layout O(N) text on every drop.
+        self.file_list.append(f"{len(self.selected_files)}. {filename} ({file_size:.1f} KB)\n"
+                              f"   Path: {file_path}")
+
     def handle_dropped_files(self, files):
         """Handle files dropped into the drop zone"""
         for file_path in files:
-            if file_path not in self.selected_files:
-                self.selected_files.append(file_path)
-        
+            if file_path not in self._selected_set:
+                self._add_file(file_path)
+
         self.update_file_list()
         self.status_label.setText(f"✅ Added {len(files)} PDF file(s)")
     
@@ -270,29 +314,22 @@ class PDFDropDialog(QMainWindow):
         
         if files:
             for file_path in files:
-                if file_path not in self.selected_files:
-                    self.selected_files.append(file_path)
-            
+                if file_path not in self._selected_set:
+                    self._add_file(file_path)
+
             self.update_file_list()
             self.status_label.setText(f"✅ Added {len(files)} PDF file(s) via browse")
     
     def clear_files(self):
         """Clear all selected files"""
         self.selected_files.clear()
+        self._selected_set.clear()
         self.update_file_list()
         self.status_label.setText("🗑️ All files cleared")
     
     def update_file_list(self):
-        """Update the file list display"""
+        """Update the buttons and status for the current selection"""
         if self.selected_files:
-            file_text = ""
-            for i, file_path in enumerate(self.selected_files, 1):
-                filename = os.path.basename(file_path)
-                file_size = os.path.getsize(file_path) / 1024  # KB
-                file_text += f"{i}. {filename} ({file_size:.1f} KB)\n"
-                file_text += f"   Path: {file_path}\n\n"
-            
-            self.file_list.setText(file_text.strip())
             self.process_btn.setEnabled(True)
             self.status_label.setText(f"📁 {len(self.selected_files)} PDF file(s) ready")
         else:
@@ -306,27 +343,68 @@ class PDFDropDialog(QMainWindow):
             QMessageBox.warning(self, "No Files", "Please select PDF files first.")
             return
         
-        # Here you can add your PDF processing logic
-        # For now, let's just show the file paths
-        
-        message = f"Processing {len(self.selected_files)} PDF file(s):\n\n"
-        for i, file_path in enumerate(self.selected_files, 1):
-            message += f"{i}. {os.path.basename(file_path)}\n"
-        
-        message += f"\n📂 File paths available in self.selected_files list"
-        
+        # Run the parallel extraction in a worker thread so the event
+        # loop keeps repainting; results come back via extraction_finished.
+        self._processing_files = list(self.selected_files)
+        self._set_buttons_enabled(False)
+        self.status_label.setText("⏳ Extracting text from PDF file(s)...")
+        threading.Thread(
+            target=self._run_extraction,
+            args=(self._processing_files,),
+            daemon=True
+        ).start()
+
+    def _run_extraction(self, files):
+        """Extract the files off the GUI thread and signal the results"""
+        try:
+            results = extract_pdfs(files)
+        except Exception as e:
+            # The executor itself can raise (e.g. BrokenProcessPool when a
+            # malformed PDF crashes a worker); report it instead of dying
+            # silently and leaving the buttons disabled forever.
+            self.extraction_failed.emit(str(e))
+            return
+        self.extraction_finished.emit(results)
+
+    def _set_buttons_enabled(self, enabled):
+        """Toggle the action buttons while extraction is running"""
+        self.browse_btn.setEnabled(enabled)
+        self.clear_btn.setEnabled(enabled)
+        self.process_btn.setEnabled(enabled and bool(self.selected_files))
+
+    def show_extraction_error(self, error):
+        """Report a failed extraction run (runs back on the GUI thread)"""
+        QMessageBox.critical(self, "Processing Failed",
+                             f"Could not extract the selected PDFs:\n{error}")
+        self._set_buttons_enabled(True)
+        self.status_label.setText("❌ Processing failed")
+
+    def show_extraction_results(self, results):
+        """Report extraction results (runs back on the GUI thread)"""
+        files = self._processing_files
+
+        message = f"Processed {len(files)} PDF file(s):\n\n"
+        for i, (file_path, text) in enumerate(zip(files, results), 1):
+            chars = len(text) if text else 0
+            message += f"{i}. {os.path.basename(file_path)} ({chars} characters)\n"
+
+        message += f"\n📂 Extracted text available per file"
+
         QMessageBox.information(self, "Processing Files", message)
-        
+
         # Print file paths to console for development
         print("🔧 PDF File Paths:")
-        for file_path in self.selected_files:
+        for file_path in files:
             print(f"   📄 {file_path}")
-        
+
+        self._set_buttons_enabled(True)
         self.status_label.setText("✅ Processing completed!")
 
 def main():
     """Main function to run the application"""
-    app = QApplication(sys.argv)
+    # Reuse an existing QApplication if one is already running so this
+    # module stays safe to call from other code; Qt allows only one.
+    app = QApplication.instance() or QApplication(sys.argv)
     
     # Set application properties
     app.setApplicationName("PDF Drag & Drop Processor")
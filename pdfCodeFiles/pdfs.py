@@ -1,20 +1,66 @@
-from PyPDF2 import PdfReader # type: ignore
+import pypdfium2 as pdfium # type: ignore
+import hashlib
 import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Extracted text is cached on disk so re-running the tool on an unchanged
+# PDF returns the saved text instead of re-extracting every page.
+_CACHE_DIR = pathlib.Path('.pdf_cache')
+
+def _cache_path(file_path):
+    """Cache file for a PDF, keyed by its path, mtime, and size."""
+    stat = os.stat(file_path)
+    key = hashlib.blake2b(
+        f"{file_path}|{stat.st_mtime}|{stat.st_size}".encode()
+    ).hexdigest()
+    return _CACHE_DIR / key
+
+def _write_cache(cache_file, text):
+    """Write extracted text to the cache atomically."""
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        # Write to a per-process temp file and rename into place so a
+        # half-written cache entry is never visible to other readers.
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(text, encoding='utf-8')
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        print(f"❌ Error writing PDF cache: {e}")
+
+def read_pdf(file_path, verbose=False):
+    """Read and extract text from a PDF file, caching the result on disk."""
+    try:
+        cache_file = _cache_path(file_path)
+        if cache_file.exists():
+            print(f"✅ Using cached text for: {file_path}")
+            return cache_file.read_text(encoding='utf-8')
+    except OSError:
+        # Missing file or unreadable cache; fall through to extraction,
+        # which reports the error the same way as before.
+        cache_file = None
 
-def read_pdf(file_path):
-    """Read and extract text from a PDF file."""
     try:
-        reader = PdfReader(file_path)
+        pdf = pdfium.PdfDocument(file_path)
         print(f"✅ Successfully opened: {file_path}")
-        print(f"📄 Number of pages: {len(reader.pages)}")
-        
-        # Extract text from all pages
-        full_text = ""
-        for page_num, page in enumerate(reader.pages):
-            page_text = page.extract_text()
-            full_text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-            print(f"📖 Page {page_num + 1}: {len(page_text)} characters")
-        
+        print(f"📄 Number of pages: {len(pdf)}")
+
+        # Extract text from all pages (text layout runs in PDFium's C code).
+        # Collect pieces in a list and join once at the end; repeated +=
+        # on a string can turn quadratic for PDFs with many pages.
+        parts = []
+        append = parts.append
+        for page_num in range(len(pdf)):
+            page_text = pdf[page_num].get_textpage().get_text_range()
+            append(f"\n--- Page {page_num + 1} ---\n")
+            append(page_text)
+            append("\n")
+            if verbose:
+                print(f"📖 Page {page_num + 1}: {len(page_text)} characters")
+
+        full_text = ''.join(parts)
+        if cache_file is not None:
+            _write_cache(cache_file, full_text)
         return full_text
     except FileNotFoundError:
         print(f"❌ File not found: {file_path}")
@@ -23,38 +69,71 @@ def read_pdf(file_path):
         print(f"❌ Error reading PDF: {e}")
         return None
 
+def read_pdf_stream(file_path, out=None):
+    """
+    Yield extracted text page by page, optionally writing it to a file.
+
+    Streaming keeps only one page's text in memory at a time instead of
+    the whole document, which matters for PDFs with hundreds of pages.
+    """
+    pdf = pdfium.PdfDocument(file_path)
+    writer = open(out, 'w', encoding='utf-8', buffering=1 << 20) if out else None
+    try:
+        for page_num in range(len(pdf)):
+            page_text = pdf[page_num].get_textpage().get_text_range()
+            chunk = f"\n--- Page {page_num + 1} ---\n{page_text}\n"
+            if writer:
+                writer.write(chunk)
+            yield chunk
+    finally:
+        if writer:
+            writer.close()
+
 def get_pdf_info(file_path):
     """Get detailed information about a PDF file."""
     try:
-        reader = PdfReader(file_path)
-        
+        pdf = pdfium.PdfDocument(file_path)
+
         print(f"\n📊 PDF Information for: {file_path}")
-        print(f"   📄 Pages: {len(reader.pages)}")
-        print(f"   🔒 Encrypted: {reader.is_encrypted}")
-        
-        # Metadata
-        if reader.metadata:
+        print(f"   📄 Pages: {len(pdf)}")
+
+        # Metadata (fetched as a native dict in a single call)
+        metadata = pdf.get_metadata_dict(skip_empty=True)
+        if metadata:
             print(f"   📝 Metadata:")
-            for key, value in reader.metadata.items():
-                if value:
-                    print(f"      {key}: {value}")
-        
+            for key, value in metadata.items():
+                print(f"      {key}: {value}")
+
         return True
     except Exception as e:
         print(f"❌ Error getting PDF info: {e}")
         return False
 
+def extract_pdfs(pdf_files):
+    """Extract text from several PDF files in parallel."""
+    if len(pdf_files) <= 1:
+        return [read_pdf(f) for f in pdf_files]
+
+    # Each PDF is independent, so hand one file to each worker process
+    # and let every core extract at the same time.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(read_pdf, pdf_files, chunksize=1))
+
 def list_pdf_files():
     """List all PDF files in the current directory."""
-    pdf_dir = "./PDFs"
-    pdf_files = [f for f in os.listdir(pdf_dir) if f.lower().endswith('.pdf')]
+    pdf_dir = pathlib.Path('./PDFs')
+    # glob fuses directory enumeration and extension filtering; the set
+    # union covers the same case spellings the drag-and-drop dialog
+    # accepts, without lowercasing each name.
+    pdf_paths = sorted({*pdf_dir.glob('*.pdf'), *pdf_dir.glob('*.PDF'),
+                        *pdf_dir.glob('*.Pdf')})
 
-    if pdf_files:
-        print(f"🔍 Found {len(pdf_files)} PDF file(s):")
-        for i, pdf_file in enumerate(pdf_files, 1):
-            file_size = os.path.getsize(os.path.join(pdf_dir, pdf_file)) / 1024  # Size in KB
-            print(f"   {i}. {pdf_file} ({file_size:.1f} KB)")
-        return [os.path.join(pdf_dir, f) for f in pdf_files]
+    if pdf_paths:
+        print(f"🔍 Found {len(pdf_paths)} PDF file(s):")
+        for i, path in enumerate(pdf_paths, 1):
+            file_size = path.stat().st_size / 1024  # Size in KB
+            print(f"   {i}. {path.name} ({file_size:.1f} KB)")
+        return pdf_paths
     else:
         print("📭 No PDF files found in current directory")
         return []
@@ -70,29 +149,29 @@ def main():
         print(f"\n🎯 Processing first PDF file: {pdf_files[0]}")
         
         # Get PDF info
-        print("pdf_info: " + pdf_files[0])
+        print(f"pdf_info: {pdf_files[0]}")
         get_pdf_info(pdf_files[0])
         
         # Ask user if they want to read the content
         print(f"\n📖 Would you like to extract text from '{pdf_files[0]}'?")
         print("   (This will show the text content)")
         
-        # For demo purposes, let's just show the first few characters
-        text = read_pdf(pdf_files[0])
-        if text:
+        # Stream pages straight to the output file so the full document
+        # never has to sit in memory; keep just enough for the preview.
+        output_file = f"{pdf_files[0]}_extracted.txt"
+        try:
+            preview = ""
+            for page_text in read_pdf_stream(pdf_files[0], out=output_file):
+                if len(preview) < 200:
+                    preview += page_text
+
             print(f"\n📄 Text preview (first 200 characters):")
             print("-" * 50)
-            print(text[:200] + "..." if len(text) > 200 else text)
+            print(preview[:200] + "..." if len(preview) > 200 else preview)
             print("-" * 50)
-            
-            # Optionally save to file
-            output_file = f"{pdf_files[0]}_extracted.txt"
-            try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(text)
-                print(f"💾 Full text saved to: {output_file}")
-            except Exception as e:
-                print(f"❌ Error saving text file: {e}")
+            print(f"💾 Full text saved to: {output_file}")
+        except Exception as e:
+            print(f"❌ Error extracting PDF: {e}")
     else:
         print("\n💡 To test this script:")
         print("   1. Place a PDF file in this directory")
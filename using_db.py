@@ -1,4 +1,4 @@
-from db_utils import DatabaseConnection
+from db_utils import DatabaseConnection, bulk_insert
 
 def main():
     print("Testing database connection with context manager...")
@@ -8,6 +8,9 @@ def main():
         with DatabaseConnection() as db:
             # Perform database operations here
             print("connection established inside context manager.")
+            # Batch inserts go through one prepared statement, e.g.:
+            # bulk_insert(db, "pdf_files", ["name", "pages"],
+            #             [("report.pdf", 12), ("notes.pdf", 3)])
             pass
     except Exception as e:
         print(f"An error occurred: {e}")